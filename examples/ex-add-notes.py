@@ -30,10 +30,16 @@ def main():
         raise ValueError("Clip at [0, 0] must be a MIDI clip")
 
     print("Populating clip [0, 0] with random notes")
+    notes = []
     for n in range(32):
         note = generate_random_note(clip)
         print(" - Adding note %d at time %.2f" % (note[0], note[1]))
-        clip.add_note(*note)
+        notes.append(note)
+
+    #--------------------------------------------------------------------------------
+    # Send all of the notes to Live in a single message.
+    #--------------------------------------------------------------------------------
+    clip.add_notes(notes)
 
 def generate_random_note(clip: live.Clip):
     #--------------------------------------------------------------------------------
@@ -1,19 +1,56 @@
+from __future__ import annotations
+
+import sys
+import math
+import time
 import logging
 
-import live.query
-import live.object
 from live.constants import *
 from live.query import Query
 
-def make_getter(class_identifier, prop):
+#------------------------------------------------------------------------
+# Symbols used to display each clip state in Clip.__str__
+#------------------------------------------------------------------------
+_STATE_SYMBOLS = {
+    CLIP_STATUS_EMPTY: " ",
+    CLIP_STATUS_STOPPED: "-",
+    CLIP_STATUS_PLAYING: ">",
+    CLIP_STATUS_STARTING: "*"
+}
+
+#------------------------------------------------------------------------
+# The OSC path and immutability of each property created by make_getter,
+# keyed by property name, for use by Clip.snapshot.
+#------------------------------------------------------------------------
+_GETTERS = {}
+
+def make_getter(class_identifier, prop, immutable: bool = False):
+    """
+    If immutable is True, the property is assumed never to change for the
+    lifetime of the clip, so is queried once and then cached until refresh().
+    """
+    path = sys.intern("/live/%s/get/%s" % (class_identifier, prop))
+    _GETTERS[prop] = (path, immutable)
+
     def fn(self):
-        return self.live.query("/live/%s/get/%s" % (class_identifier, prop), (self.track.index, self.index,))[2]
+        ttl = math.inf if immutable else self.cache_ttl
+        if ttl > 0:
+            hit = self._cache.get(prop)
+            if hit is not None and time.monotonic() - hit[1] < ttl:
+                return hit[0]
+        value = self.live.query(path, self._addr)[2]
+        if ttl > 0:
+            self._cache[prop] = (value, time.monotonic())
+        return value
 
     return fn
 
 def make_setter(class_identifier, prop):
+    path = sys.intern("/live/%s/set/%s" % (class_identifier, prop))
+
     def fn(self, value):
-        self.live.cmd("/live/%s/set/%s" % (class_identifier, prop), (self.track.index, self.index, value))
+        self._cache.pop(prop, None)
+        self.live.cmd(path, self._addr + (value,))
 
     return fn
 
@@ -22,6 +59,20 @@ class Clip:
     An object representing a single clip in a Live set.
     """
 
+    #------------------------------------------------------------------------
+    # A Live set may contain many hundreds of clips, so avoid a per-instance
+    # __dict__.
+    #------------------------------------------------------------------------
+    __slots__ = ("track", "set", "index", "name", "length", "state", "logger", "live", "_cache", "_addr")
+
+    #------------------------------------------------------------------------
+    # Number of seconds for which queried property values are cached locally,
+    # so that repeated reads (e.g. within a single animation frame) don't
+    # each require an OSC round-trip. Disabled (0) by default, as cached
+    # values will fall out of sync if the clip is modified from within Live.
+    #------------------------------------------------------------------------
+    cache_ttl: float = 0.0
+
     def __init__(self, track, index: int, name: str, length: float = 4):
         """ Create a new clip.
 
@@ -38,23 +89,15 @@ class Clip:
         self.length = length
         self.state = CLIP_STATUS_STOPPED
         self.logger = logging.getLogger(__name__)
-        # self.live = Query()
-
-    @property
-    def live(self):
-        return Query()
+        self.live: Query = Query()
+        self._cache: dict = {}
+        self._update_addr()
 
     def __str__(self):
-        name = ": %s" % self.name if self.name else ""
-        state_symbols = {
-            CLIP_STATUS_EMPTY: " ",
-            CLIP_STATUS_STOPPED: "-",
-            CLIP_STATUS_PLAYING: ">",
-            CLIP_STATUS_STARTING: "*"
-        }
-        state_symbol = state_symbols[self.state]
+        name = f": {self.name}" if self.name else ""
+        state_symbol = _STATE_SYMBOLS[self.state]
 
-        return "Clip (%d,%d)%s [%s]" % (self.track.index, self.index, name, state_symbol)
+        return f"Clip ({self.track.index},{self.index}){name} [{state_symbol}]"
 
     def __getstate__(self):
         return {
@@ -62,6 +105,7 @@ class Clip:
             "index": self.index,
             "name": self.name,
             "length": self.length,
+            "addr": self._addr,
         }
 
     def __setstate__(self, d: dict):
@@ -69,32 +113,107 @@ class Clip:
         self.index = d["index"]
         self.name = d["name"]
         self.length = d["length"]
+        self.live = Query()
+        self._cache = {}
+
+        #------------------------------------------------------------------------
+        # Restore the address from the pickled state rather than recomputing
+        # it, as our track may not yet have had its own state restored.
+        # Clips pickled by older versions have no address: leave it unset, and
+        # __getattr__ will compute it on first use.
+        #------------------------------------------------------------------------
+        if "addr" in d:
+            self._addr = d["addr"]
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. when _addr has not been set.
+        if name == "_addr":
+            self._update_addr()
+            return self._addr
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def _update_addr(self):
+        """
+        Cache the (track_index, clip_index) pair that prefixes every OSC message
+        for this clip. Must be called if the clip's track or index changes.
+        """
+        self._addr = (self.track.index, self.index)
+
+    def snapshot(self, props: list[str]) -> dict:
+        """
+        Query several properties of this clip at once. Values that are already
+        cached are returned directly; the remaining queries are sent together
+        and their responses awaited in parallel, so reading N properties costs
+        roughly one round-trip rather than N.
+
+        Args:
+            props: Names of the properties to query, e.g. ["is_playing", "pitch_coarse"]
+
+        Returns:
+            A dict mapping each property name to its current value.
+
+        Raises:
+            ValueError: If any of props is not a queryable clip property
+        """
+        unsupported = [prop for prop in props if prop not in _GETTERS]
+        if unsupported:
+            raise ValueError("Unsupported clip properties for snapshot: %s (valid properties: %s)" %
+                             (", ".join(unsupported), ", ".join(sorted(_GETTERS))))
+
+        values = {}
+        to_query = []
+        now = time.monotonic()
+        for prop in props:
+            path, immutable = _GETTERS[prop]
+            ttl = math.inf if immutable else self.cache_ttl
+            hit = self._cache.get(prop) if ttl > 0 else None
+            if hit is not None and now - hit[1] < ttl:
+                values[prop] = hit[0]
+            else:
+                to_query.append((prop, path, ttl))
+
+        responses = self.live.query_batch([(path, self._addr) for prop, path, ttl in to_query])
+        now = time.monotonic()
+        for (prop, path, ttl), response in zip(to_query, responses):
+            values[prop] = response[2]
+            if ttl > 0:
+                self._cache[prop] = (values[prop], now)
+
+        return {prop: values[prop] for prop in props}
+
+    def refresh(self):
+        """
+        Discard any locally-cached property values, so that the next read of
+        each property queries Live afresh.
+        """
+        self._cache.clear()
 
     def play(self):
         """
         Start playing clip.
         Must use clip_slot (not clip) as this is also used in group tracks, which have clip_slots without clips.
         """
-        self.live.cmd("/live/clip_slot/fire", (self.track.index, self.index))
+        self._cache.pop("is_playing", None)
+        self.live.cmd("/live/clip_slot/fire", self._addr)
         self.track.playing = True
-        if type(self.track) is live.Group:
+        if self.track.is_group:
+            #------------------------------------------------------------------------
+            # when we trigger a group clip, it triggers each of the corresponding
+            # clips in the tracks it contains. thus need to update the playing
+            # status of each of our tracks, assuming that all clips/stop buttons
+            # are enabled.
+            #------------------------------------------------------------------------
+            index = self.index
             for track in self.track.tracks:
-                #------------------------------------------------------------------------
-                # when we trigger a group clip, it triggers each of the corresponding
-                # clips in the tracks it contains. thus need to update the playing
-                # status of each of our tracks, assuming that all clips/stop buttons
-                # are enabled.
-                #------------------------------------------------------------------------
-                if self.index < len(track.clips) and track.clips[self.index] is not None:
-                    track.playing = True
-                else:
-                    track.playing = False
+                clips = track.clips
+                track.playing = index < len(clips) and clips[index] is not None
 
     def stop(self):
         """
         Stop playing clip.
         """
-        self.live.cmd("/live/clip/stop", (self.track.index, self.index))
+        self._cache.pop("is_playing", None)
+        self.live.cmd("/live/clip/stop", self._addr)
         self.track.playing = False
 
     def add_note(self,
@@ -113,7 +232,75 @@ class Clip:
             velocity: The MIDI velocity of the note, from 0..127
             mute: If True, mutes the note.
         """
-        self.live.cmd("/live/clip/add/notes", (self.track.index, self.index, pitch, start_time, duration, velocity, mute))
+        self.live.cmd("/live/clip/add/notes", self._addr + (pitch, start_time, duration, velocity, mute))
+
+    def add_notes(self, notes: list[tuple]) -> None:
+        """
+        Add multiple MIDI note events to this clip in a single OSC message.
+        Much faster than repeated calls to add_note() when adding many notes.
+
+        Args:
+            notes: An iterable of (pitch, start_time, duration, velocity, mute) tuples,
+                   with values as described in add_note().
+
+        Raises:
+            ValueError: If any note does not have exactly five fields
+        """
+        #------------------------------------------------------------------------
+        # Unpack each note so that a malformed note raises, rather than
+        # shifting the fields of every subsequent note in the message.
+        #------------------------------------------------------------------------
+        args = list(self._addr)
+        for pitch, start_time, duration, velocity, mute in notes:
+            args.extend((pitch, start_time, duration, velocity, mute))
+
+        #------------------------------------------------------------------------
+        # Don't send an empty message if there were no notes. This is checked
+        # after unpacking as notes may be any iterable, including a generator.
+        #------------------------------------------------------------------------
+        if len(args) == len(self._addr):
+            return
+        self.live.cmd("/live/clip/add/notes", tuple(args))
+
+    def get_notes(self) -> list[tuple]:
+        """
+        Query the MIDI notes contained in this clip.
+
+        Returns:
+            A list of (pitch, start_time, duration, velocity, mute) tuples,
+            in the same format accepted by add_note().
+        """
+        response = self.live.query("/live/clip/get/notes", self._addr)
+
+        #------------------------------------------------------------------------
+        # The response is (track_index, clip_index) followed by five values per
+        # note. Zipping the same iterator five times groups these into tuples
+        # without repeatedly slicing the response.
+        #------------------------------------------------------------------------
+        it = iter(response[2:])
+        return list(zip(it, it, it, it, it))
+
+    def get_notes_array(self) -> dict:
+        """
+        Query the MIDI notes contained in this clip, returning one NumPy array
+        per note field. Useful for vectorised processing of large clips
+        (transposition, quantisation, etc). Requires numpy.
+
+        Returns:
+            A dict with keys "pitch", "start_time", "duration", "velocity" and
+            "mute", each mapping to an array with one element per note.
+        """
+        import numpy as np
+
+        response = self.live.query("/live/clip/get/notes", self._addr)
+        notes = response[2:]
+        return {
+            "pitch": np.asarray(notes[0::5], dtype=np.uint8),
+            "start_time": np.asarray(notes[1::5], dtype=np.float64),
+            "duration": np.asarray(notes[2::5], dtype=np.float64),
+            "velocity": np.asarray(notes[3::5], dtype=np.float64),
+            "mute": np.asarray(notes[4::5], dtype=bool),
+        }
 
     pitch_coarse = property(fget=make_getter("clip", "pitch_coarse"),
                             fset=make_setter("clip", "pitch_coarse"),
@@ -123,10 +310,10 @@ class Clip:
                           fset=make_setter("clip", "is_playing"),
                           doc="True if the clip is playing, False otherwise")
 
-    is_midi_clip = property(fget=make_getter("clip", "is_midi_clip"),
+    is_midi_clip = property(fget=make_getter("clip", "is_midi_clip", immutable=True),
                             fset=make_setter("clip", "is_midi_clip"),
                             doc="True if the clip is a MIDI clip, False otherwise")
 
-    is_audio_clip = property(fget=make_getter("clip", "is_audio_clip"),
+    is_audio_clip = property(fget=make_getter("clip", "is_audio_clip", immutable=True),
                              fset=make_setter("clip", "is_audio_clip"),
                              doc="True if the clip is an audio clip, False otherwise")
@@ -27,14 +27,34 @@ class Parameter:
         self.is_quantized = False
         self.indent = 3
         self.logger = logging.getLogger(__name__)
-
-    @property
-    def live(self):
-        return Query()
+        self.live: Query = Query()
 
     def __str__(self):
         return "Parameter (%d,%d,%d): %s (range %.3f-%.3f)" % (self.device.track.index, self.device.index, self.index, self.name, self.min, self.max)
 
+    def __getstate__(self):
+        return {
+            "device": self.device,
+            "index": self.index,
+            "name": self.name,
+            "_value": self._value,
+            "min": self.min,
+            "max": self.max,
+            "is_quantized": self.is_quantized,
+        }
+
+    def __setstate__(self, d: dict):
+        self.device = d["device"]
+        self.index = d["index"]
+        self.name = d["name"]
+        self._value = d["_value"]
+        self.min = d["min"]
+        self.max = d["max"]
+        self.is_quantized = d["is_quantized"]
+        self.indent = 3
+        self.logger = logging.getLogger(__name__)
+        self.live = Query()
+
     @property
     def set(self):
         """ Returns the Set that this parameter resides within. """
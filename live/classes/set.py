@@ -24,14 +24,18 @@ from ..exceptions import LiveIOError, LiveConnectionError
 
 def make_getter(class_identifier, prop):
     # TODO: Replacement for name_cache
+    path = sys.intern("/live/%s/get/%s" % (class_identifier, prop))
+
     def fn(self):
-        return self.live.query("/live/%s/get/%s" % (class_identifier, prop))[0]
+        return self.live.query(path)[0]
 
     return fn
 
 def make_setter(class_identifier, prop):
+    path = sys.intern("/live/%s/set/%s" % (class_identifier, prop))
+
     def fn(self, value):
-        self.live.cmd("/live/%s/set/%s" % (class_identifier, prop), (value,))
+        self.live.cmd(path, (value,))
 
     return fn
 
@@ -11,19 +11,24 @@ if TYPE_CHECKING:
     from .group import Group
     from .set import Set
 
+import sys
 import logging
 
 logger = logging.getLogger(__name__)
 
 def make_getter(class_identifier, prop):
+    path = sys.intern("/live/%s/get/%s" % (class_identifier, prop))
+
     def fn(self):
-        return self.live.query("/live/%s/get/%s" % (class_identifier, prop), (self.index,))[1]
+        return self.live.query(path, (self.index,))[1]
 
     return fn
 
 def make_setter(class_identifier, prop):
+    path = sys.intern("/live/%s/set/%s" % (class_identifier, prop))
+
     def fn(self, value):
-        self.live.cmd("/live/%s/set/%s" % (class_identifier, prop), (self.index, value))
+        self.live.cmd(path, (self.index, value))
 
     return fn
 
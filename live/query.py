@@ -31,6 +31,9 @@ def query(*args, **kwargs):
 def cmd(*args, **kwargs):
     Query().cmd(*args, **kwargs)
 
+def query_batch(*args, **kwargs):
+    return Query().query_batch(*args, **kwargs)
+
 @singleton
 class Query:
     """
@@ -44,6 +47,7 @@ class Query:
 
         live.query(path, *args)
         live.cmd(path, *args)
+        live.query_batch([(path, args), ...])
     """
 
     def __init__(self, address=("127.0.0.1", 11000), listen_port=11001):
@@ -74,6 +78,14 @@ class Query:
         self.query_address = None
         self.query_rv = []
 
+        #------------------------------------------------------------------------
+        # In-flight query_batch() calls, oldest first. Each may be issued from a
+        # different thread, and replies are handled on the server threads, so
+        # guard with a lock.
+        #------------------------------------------------------------------------
+        self.batch_lock = threading.Lock()
+        self.batches = []
+
         self.listen()
 
     def listen(self):
@@ -138,6 +150,63 @@ class Query:
 
         return self.query_rv
 
+    def query_batch(self, queries: list, timeout: float = None) -> list:
+        """
+        Send several Live queries at once, then wait for all of their responses,
+        so that the round-trip latency is paid once rather than per query:
+
+        return live.query_batch([("/live/track/get/volume", (0,)),
+                                 ("/live/track/get/volume", (1,))])
+
+        Responses are matched to queries by their address and leading values,
+        which AbletonOSC echoes from the query's arguments.
+
+        Batches may be issued concurrently from several threads: each call keeps
+        its own pending state, and each reply is given to the oldest in-flight
+        batch awaiting that address and arguments. As replies carry no request
+        ID, a reply that arrives after its batch has timed out may still be
+        taken by a later batch making the identical query.
+
+        Returns a list of responses (each a list of values), in the same order
+        as the queries.
+        """
+        if not queries:
+            return []
+
+        #------------------------------------------------------------------------
+        # pending maps each address to a map from the query's arguments to the
+        # indices of the queries awaiting that reply.
+        #------------------------------------------------------------------------
+        pending = {}
+        for index, (msg, args) in enumerate(queries):
+            pending.setdefault(msg, {}).setdefault(tuple(args), []).append(index)
+        batch = {
+            "pending": pending,
+            "rv": [None] * len(queries),
+            "event": threading.Event(),
+        }
+
+        with self.batch_lock:
+            self.batches.append(batch)
+            to_send = [(msg, args) for msg in pending for args in pending[msg]]
+
+        try:
+            for msg, args in to_send:
+                self.cmd(msg, args)
+
+            if timeout is None:
+                timeout = self.osc_timeout
+            rv = batch["event"].wait(timeout)
+        finally:
+            with self.batch_lock:
+                self.batches.remove(batch)
+                missing = [(msg, args) for msg in pending for args in pending[msg]]
+
+        if not rv:
+            raise LiveConnectionError("Timed out waiting for response to queries: %s. Is Live running and AbletonOSC installed?" % missing)
+
+        return batch["rv"]
+
     def osc_handler(self, address, *args):
         self.handler(address, args)
 
@@ -151,6 +220,29 @@ class Query:
             for handler in self.handlers[address]:
                 handler(*data)
 
+        #------------------------------------------------------------------------
+        # If this message answers a query in an in-flight batch, store it, and
+        # wake the caller once every query in the batch has been answered.
+        # A reply claimed by a batch must not also be taken as the return value
+        # of a synchronous query on the same address.
+        #------------------------------------------------------------------------
+        if self.batches:
+            with self.batch_lock:
+                for batch in self.batches:
+                    queries_by_args = batch["pending"].get(address)
+                    if not queries_by_args:
+                        continue
+                    args = next((args for args in queries_by_args if tuple(data[:len(args)]) == args), None)
+                    if args is None:
+                        continue
+                    for index in queries_by_args.pop(args):
+                        batch["rv"][index] = list(data)
+                    if not queries_by_args:
+                        del batch["pending"][address]
+                    if not batch["pending"]:
+                        batch["event"].set()
+                    return
+
         #------------------------------------------------------------------------
         # If this message is awaiting a synchronous return, trigger the
         # thread event and update our return value. 
@@ -13,6 +13,7 @@ setup(
     url = 'https://github.com/ideoforms/pylive',
     packages = find_packages(),
     install_requires = ['python-osc'],
+    extras_require = {'numpy': ['numpy']},
     keywords = ('sound', 'music', 'ableton', 'osc'),
     classifiers = [
         'Topic :: Multimedia :: Sound/Audio',
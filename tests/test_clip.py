@@ -2,6 +2,8 @@
 
 import pytest
 import time
+import pickle
+import threading
 import live
 
 from .shared import open_test_set, live_set
@@ -21,6 +23,26 @@ def audio_clip(live_set):
     clip = track.clips[0]
     return clip
 
+@pytest.fixture
+def queries(monkeypatch):
+    """ Record the address of each OSC query sent during a test. """
+    queries = []
+    query = live.Query()
+    original_query = query.query
+    original_query_batch = query.query_batch
+
+    def recording_query(msg, *args, **kwargs):
+        queries.append(msg)
+        return original_query(msg, *args, **kwargs)
+
+    def recording_query_batch(batch, *args, **kwargs):
+        queries.extend(msg for msg, _ in batch)
+        return original_query_batch(batch, *args, **kwargs)
+
+    monkeypatch.setattr(query, "query", recording_query)
+    monkeypatch.setattr(query, "query_batch", recording_query_batch)
+    return queries
+
 def test_clip_properties(clip, live_set):
     assert clip.track == live_set.tracks[1]
     assert clip.set == live_set
@@ -42,3 +64,175 @@ def test_clip_pitch_coarse(audio_clip):
     audio_clip.pitch_coarse = -24
     assert audio_clip.pitch_coarse == -24
     audio_clip.pitch_coarse = 0
+
+def test_clip_cache(audio_clip, queries, monkeypatch):
+    path = "/live/clip/get/pitch_coarse"
+    monkeypatch.setattr(live.Clip, "cache_ttl", 0.5)
+    audio_clip.refresh()
+    try:
+        # a second read within the TTL is served from the cache
+        assert audio_clip.pitch_coarse == 0
+        assert audio_clip.pitch_coarse == 0
+        assert queries.count(path) == 1
+
+        # once the TTL has expired, Live is queried again
+        time.sleep(0.6)
+        assert audio_clip.pitch_coarse == 0
+        assert queries.count(path) == 2
+
+        # setting a value invalidates it
+        audio_clip.pitch_coarse = -12
+        assert audio_clip.pitch_coarse == -12
+        assert queries.count(path) == 3
+        audio_clip.pitch_coarse = 0
+    finally:
+        audio_clip.refresh()
+
+def test_clip_get_notes(live_set):
+    track = live_set.tracks[1]
+    clip = track.create_clip(6, 4.0)
+    try:
+        clip.add_note(60, 0.0, 1.0, 100, False)
+        clip.add_note(64, 1.0, 0.5, 80, False)
+        assert sorted(clip.get_notes()) == [(60, 0.0, 1.0, 100, False),
+                                            (64, 1.0, 0.5, 80, False)]
+    finally:
+        track.delete_clip(6)
+
+def test_clip_add_notes(live_set):
+    track = live_set.tracks[1]
+    clip = track.create_clip(6, 4.0)
+    try:
+        notes = [(60, 0.0, 1.0, 100, False),
+                 (62, 1.0, 1.0, 90, False),
+                 (64, 2.0, 1.0, 80, False)]
+        clip.add_notes(notes)
+        assert sorted(clip.get_notes()) == notes
+    finally:
+        track.delete_clip(6)
+
+def test_clip_type(clip, audio_clip, queries):
+    clip.refresh()
+    audio_clip.refresh()
+    for _ in range(2):
+        assert clip.is_midi_clip
+        assert not clip.is_audio_clip
+        assert audio_clip.is_audio_clip
+        assert not audio_clip.is_midi_clip
+
+    # clip type is cached regardless of cache_ttl: one query per clip
+    assert live.Clip.cache_ttl == 0.0
+    assert queries.count("/live/clip/get/is_midi_clip") == 2
+    assert queries.count("/live/clip/get/is_audio_clip") == 2
+
+def test_clip_type_refresh(clip, queries):
+    assert clip.is_midi_clip
+    count = queries.count("/live/clip/get/is_midi_clip")
+    clip.refresh()
+    assert clip.is_midi_clip
+    assert queries.count("/live/clip/get/is_midi_clip") == count + 1
+
+def test_clip_get_notes_array(live_set):
+    np = pytest.importorskip("numpy")
+    track = live_set.tracks[1]
+    clip = track.create_clip(6, 4.0)
+    try:
+        clip.add_notes([(60, 0.0, 1.0, 100, False),
+                        (64, 1.0, 0.5, 80, True)])
+        notes = clip.get_notes_array()
+        order = np.argsort(notes["start_time"])
+        assert list(notes["pitch"][order]) == [60, 64]
+        assert list(notes["start_time"][order]) == [0.0, 1.0]
+        assert list(notes["duration"][order]) == [1.0, 0.5]
+        assert list(notes["velocity"][order]) == [100, 80]
+        assert list(notes["mute"][order]) == [False, True]
+    finally:
+        track.delete_clip(6)
+
+def test_clip_snapshot(clip):
+    values = clip.snapshot(["is_playing", "is_midi_clip", "is_audio_clip"])
+    assert values == {"is_playing": False, "is_midi_clip": True, "is_audio_clip": False}
+
+def test_clip_pickle(clip):
+    track = pickle.loads(pickle.dumps(clip.track))
+    restored = track.clips[clip.index]
+    assert restored.track is track
+    assert restored.index == clip.index
+    assert restored.name == clip.name
+    assert restored._addr == clip._addr
+
+def test_clip_unpickle_without_addr(clip):
+    # state as pickled before the address was stored
+    state = clip.__getstate__()
+    del state["addr"]
+    restored = live.Clip.__new__(live.Clip)
+    restored.__setstate__(state)
+    assert restored._addr == clip._addr
+
+def test_clip_add_notes_invalid(clip, monkeypatch):
+    sent = []
+    monkeypatch.setattr(clip.live, "cmd", lambda *args: sent.append(args))
+    with pytest.raises(ValueError):
+        clip.add_notes([(60, 0.0, 1.0, 100, False),
+                        (62, 1.0, 1.0, 90)])
+    clip.add_notes([])
+    clip.add_notes(iter([]))
+    assert sent == []
+
+def test_clip_snapshot_concurrent(clip, audio_clip):
+    results = {}
+
+    def poll(c):
+        results[c] = c.snapshot(["is_playing", "pitch_coarse"])
+
+    threads = [threading.Thread(target=poll, args=(c,)) for c in (clip, audio_clip)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results[clip]["is_playing"] == False
+    assert results[audio_clip] == {"is_playing": False, "pitch_coarse": 0}
+
+def test_clip_snapshot_cached(clip, queries):
+    clip.refresh()
+    assert clip.is_midi_clip
+    assert clip.snapshot(["is_midi_clip"]) == {"is_midi_clip": True}
+    assert clip.snapshot(["is_midi_clip", "is_playing"]) == {"is_midi_clip": True, "is_playing": False}
+    assert queries.count("/live/clip/get/is_midi_clip") == 1
+
+def test_clip_snapshot_with_property_reads(clip, audio_clip):
+    # a batch reply must never be returned to a synchronous query on the same address
+    responses = []
+
+    def read():
+        for _ in range(20):
+            responses.append(live.query("/live/clip/get/is_playing", clip._addr))
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    for _ in range(20):
+        assert audio_clip.snapshot(["is_playing"]) == {"is_playing": False}
+    thread.join()
+    assert len(responses) == 20
+    for response in responses:
+        assert response == [*clip._addr, False]
+
+def test_clip_play_stop_cached(clip, monkeypatch):
+    monkeypatch.setattr(live.Clip, "cache_ttl", 10.0)
+    clip.refresh()
+    try:
+        assert not clip.is_playing
+        clip.play()
+        time.sleep(0.2)
+        assert clip.is_playing
+        clip.stop()
+        time.sleep(0.2)
+        assert not clip.is_playing
+    finally:
+        clip.refresh()
+
+def test_clip_snapshot_invalid(clip):
+    with pytest.raises(ValueError) as excinfo:
+        clip.snapshot(["is_playing", "name"])
+    assert "name" in str(excinfo.value)
+    assert "is_playing" in str(excinfo.value)
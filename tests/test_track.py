@@ -2,6 +2,7 @@
 
 import pytest
 import time
+import pickle
 import live
 
 from .shared import open_test_set, live_set
@@ -124,4 +125,23 @@ def test_track_type(live_set):
     assert live_set.tracks[4].is_audio_track
     assert not (live_set.tracks[4].is_midi_track)
     assert live_set.tracks[5].is_audio_track
-    assert not (live_set.tracks[5].is_midi_track)
\ No newline at end of file
+    assert not (live_set.tracks[5].is_midi_track)
+def test_track_parameter_pickle(track):
+    parameter = track.devices[0].parameters[0]
+    restored = pickle.loads(pickle.dumps(parameter))
+    assert restored.index == parameter.index
+    assert restored.name == parameter.name
+    assert restored.min == parameter.min
+    assert restored.max == parameter.max
+    assert restored.is_quantized == parameter.is_quantized
+    assert restored.device.index == parameter.device.index
+    assert restored.value == parameter.value
+
+def test_track_parameter_unpickle_old_state(track):
+    # state as pickled before Parameter defined __getstate__, i.e. its __dict__
+    parameter = track.devices[0].parameters[0]
+    state = {**parameter.__getstate__(), "indent": 3, "logger": parameter.logger}
+    restored = live.Parameter.__new__(live.Parameter)
+    restored.__setstate__(state)
+    assert restored.name == parameter.name
+    assert restored.value == parameter.value